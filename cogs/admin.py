@@ -15,7 +15,10 @@ def _load_json(p: Path, default):
         return default
 
 def _save_json(p: Path, obj):
-    p.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+    # tmp + replace: the bot re-reads these files, so never expose a half-written one
+    tmp = p.with_suffix(".tmp")
+    tmp.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(p)
 
 class AdminCog(commands.Cog):
     """Admin utilities: silent mode + autopost targets."""
@@ -88,6 +91,7 @@ class AdminCog(commands.Cog):
 
         flags.setdefault(gid, {})["silent"] = (state == "on")
         _save_json(GUILD_FLAGS_FILE, flags)
+        self.bot.poke_autopost()
 
         await interaction.response.send_message(
             f"Silent mode set to **{state}** for this guild.",
@@ -126,6 +130,7 @@ class AdminCog(commands.Cog):
             lst.append(cid)
             ap_map[gid] = lst
             _save_json(AUTOPOST_MAP_FILE, ap_map)
+            self.bot.poke_autopost()
             msg = f"Added autopost channel {channel.mention}."
         else:
             msg = f"{channel.mention} is already in the autopost list."
@@ -144,6 +149,7 @@ class AdminCog(commands.Cog):
 
         ap_map[gid] = []
         _save_json(AUTOPOST_MAP_FILE, ap_map)
+        self.bot.poke_autopost()
 
         await interaction.response.send_message(
             "All autopost channels cleared.",
@@ -3,8 +3,9 @@ import asyncio
 import json
 import logging
 import random
+import re
+import time
 from collections import deque
-from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Deque, Dict, Optional
 
@@ -20,7 +21,9 @@ QUIPS_FILE = DATA_DIR / "auto_reply_quips.json"
 COOLDOWN_SECONDS = 5           # fixed rule — universal 5s
 CHANNEL_COOLDOWN_SECONDS = 5   # also guard the channel for 5s
 RECENT_DEDUP = 6               # avoid repeating the same quip in a channel
+COOLDOWN_SWEEP_AT = 10000      # drop expired cooldown entries past this size
 HOURGLASS = "⏳"
+NAME_MENTION_RE = re.compile(r"@aura|aura-bot", re.IGNORECASE)  # covers "@aura-bot" too
 
 FALLBACK_QUIPS = [
     "My patience is a limited-time offer.",
@@ -35,8 +38,8 @@ FALLBACK_QUIPS = [
 ]
 # ============================================================================
 
-def now() -> datetime:
-    return datetime.utcnow()
+def now() -> float:
+    return time.monotonic()
 
 def load_quips() -> list[str]:
     try:
@@ -50,14 +53,13 @@ def load_quips() -> list[str]:
                     out.append(str(r))
             return [q for q in out if q.strip()]
     except Exception as e:
-        logger.warning(f"[auto_reply] Failed to load {QUIPS_FILE.name}: {e}")
+        logger.warning("[auto_reply] Failed to load %s: %s", QUIPS_FILE.name, e)
     return FALLBACK_QUIPS.copy()
 
 def mentioned_me(msg: discord.Message, me: discord.ClientUser) -> bool:
     if me in msg.mentions:
         return True
-    c = (msg.content or "").lower()
-    return "@aura" in c or "@aura-bot" in c or "aura-bot" in c
+    return NAME_MENTION_RE.search(msg.content or "") is not None
 
 async def is_reply_to_me(msg: discord.Message, me_id: int) -> bool:
     if not msg.reference or not msg.reference.message_id:
@@ -78,14 +80,14 @@ class AutoReply(commands.Cog):
         self.quips: list[str] = load_quips()
         self.recent: Dict[int, Deque[str]] = {}
         # cooldown clocks
-        self.user_cd_until: Dict[int, datetime] = {}
-        self.chan_cd_until: Dict[int, datetime] = {}
+        self.user_cd_until: Dict[int, float] = {}
+        self.chan_cd_until: Dict[int, float] = {}
         # active countdown messages per-user (to avoid dup spam)
         self.user_countdown_msg: Dict[int, discord.Message] = {}
         # lightweight gate to reduce “race sends”
         self._send_lock = asyncio.Lock()
 
-        logger.info(f"[auto_reply] quips loaded: {len(self.quips)}")
+        logger.info("[auto_reply] quips loaded: %d", len(self.quips))
 
     # ------------------------- helpers ---------------------------------------
     def _next_quip(self, channel_id: int) -> str:
@@ -98,23 +100,33 @@ class AutoReply(commands.Cog):
 
     def _user_left(self, user_id: int) -> float:
         t = self.user_cd_until.get(user_id)
-        return max(0.0, (t - now()).total_seconds()) if t else 0.0
+        return max(0.0, t - now()) if t else 0.0
 
     def _chan_left(self, channel_id: int) -> float:
         t = self.chan_cd_until.get(channel_id)
-        return max(0.0, (t - now()).total_seconds()) if t else 0.0
+        return max(0.0, t - now()) if t else 0.0
+
+    @staticmethod
+    def _sweep(clock: Dict[int, float]) -> Dict[int, float]:
+        # every id that ever triggered a reply used to stay here forever
+        if len(clock) <= COOLDOWN_SWEEP_AT:
+            return clock
+        t = now()
+        return {k: v for k, v in clock.items() if v > t}
 
     def _arm_user(self, user_id: int):
-        self.user_cd_until[user_id] = now() + timedelta(seconds=COOLDOWN_SECONDS)
+        self.user_cd_until = self._sweep(self.user_cd_until)
+        self.user_cd_until[user_id] = now() + COOLDOWN_SECONDS
 
     def _arm_chan(self, channel_id: int):
-        self.chan_cd_until[channel_id] = now() + timedelta(seconds=CHANNEL_COOLDOWN_SECONDS)
+        self.chan_cd_until = self._sweep(self.chan_cd_until)
+        self.chan_cd_until[channel_id] = now() + CHANNEL_COOLDOWN_SECONDS
 
     async def _react_hourglass(self, msg: discord.Message):
         try:
             await msg.add_reaction(HOURGLASS)
         except Exception as e:
-            logger.debug(f"[auto_reply] hourglass react failed: {e}")
+            logger.debug("[auto_reply] hourglass react failed: %s", e)
 
     async def _countdown_nudge(self, origin: discord.Message, user_id: int, seconds: int):
         """Create or update a per-user countdown, then delete it when done."""
@@ -157,7 +169,8 @@ class AutoReply(commands.Cog):
             return
 
         got_mention = mentioned_me(message, me)
-        got_reply = await is_reply_to_me(message, me.id)
+        # a mention already qualifies; skip the reply lookup (may hit the API)
+        got_reply = got_mention or await is_reply_to_me(message, me.id)
         if not (got_mention or got_reply):
             return
 
@@ -167,8 +180,8 @@ class AutoReply(commands.Cog):
         # If cooling down -> ⏳ react + countdown (one active per user)
         if user_left > 0 or chan_left > 0:
             logger.info(
-                f"[auto_reply] cooldown hit in #{getattr(message.channel,'name',message.channel.id)} "
-                f"user_left={user_left:.1f}s chan_left={chan_left:.1f}s"
+                "[auto_reply] cooldown hit in #%s user_left=%.1fs chan_left=%.1fs",
+                getattr(message.channel, "name", message.channel.id), user_left, chan_left
             )
             await self._react_hourglass(message)
 
@@ -186,10 +199,11 @@ class AutoReply(commands.Cog):
                 self._arm_user(message.author.id)
                 self._arm_chan(message.channel.id)
                 logger.info(
-                    f"[auto_reply] replied in #{getattr(message.channel,'name',message.channel.id)}: '{text[:60]}'"
+                    "[auto_reply] replied in #%s: '%s'",
+                    getattr(message.channel, "name", message.channel.id), text[:60]
                 )
             except Exception as e:
-                logger.error(f"[auto_reply] send failed: {e}")
+                logger.error("[auto_reply] send failed: %s", e)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(AutoReply(bot))
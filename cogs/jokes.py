@@ -3,6 +3,7 @@
 # =========================
 import json
 import random
+import re
 import logging
 from pathlib import Path
 
@@ -15,12 +16,18 @@ logger = logging.getLogger("Aura")
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 JOKES_FILE = DATA_DIR / "jokes.json"
 
+_TRAIL_PIPES = re.compile(r"[\s|]+$")
+
 
 def _clean_text(s: str) -> str:
-    s = s.strip()
-    while s.endswith("||") or s.endswith("|"):
-        s = s[:-1].rstrip("|").rstrip()
-    return s
+    return _TRAIL_PIPES.sub("", s.strip())
+
+
+def _from_text(txt: str) -> dict:
+    setup, sep, punch = txt.partition("||")
+    if sep:
+        return {"setup": _clean_text(setup), "punchline": _clean_text(punch)}
+    return {"text": txt}
 
 
 def _normalize_jokes(raw):
@@ -31,12 +38,7 @@ def _normalize_jokes(raw):
     if isinstance(raw, list):
         for item in raw:
             if isinstance(item, str):
-                txt = _clean_text(item)
-                if "||" in txt:
-                    setup, punch = [_clean_text(x) for x in txt.split("||", 1)]
-                    norm.append({"setup": setup, "punchline": punch})
-                else:
-                    norm.append({"text": txt})
+                norm.append(_from_text(_clean_text(item)))
                 continue
 
             if isinstance(item, dict):
@@ -46,12 +48,7 @@ def _normalize_jokes(raw):
                         "punchline": _clean_text(item["punchline"]),
                     })
                 elif "text" in item and isinstance(item["text"], str):
-                    txt = _clean_text(item["text"])
-                    if "||" in txt:
-                        setup, punch = [_clean_text(x) for x in txt.split("||", 1)]
-                        norm.append({"setup": setup, "punchline": punch})
-                    else:
-                        norm.append({"text": txt})
+                    norm.append(_from_text(_clean_text(item["text"])))
     return norm
 
 
@@ -65,6 +62,8 @@ class JokesCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.jokes = []
+        self.rendered = []  # message text per joke, built once at load
+        self._cursor = 0
         self._load()
 
     def _load(self):
@@ -72,15 +71,25 @@ class JokesCog(commands.Cog):
             with open(JOKES_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
             self.jokes = _normalize_jokes(data)
+            self.rendered = [render_joke(j) for j in self.jokes]
+            random.shuffle(self.rendered)
+            self._cursor = 0
             logger.info("Jokes loaded: %d", len(self.jokes))
         except Exception as e:
             logger.exception("Failed to load jokes: %s", e)
             self.jokes = []
+            self.rendered = []
 
+    # shuffled deck + cursor: no repeats until every joke has been told
     def get_random_joke(self) -> str:
-        if not self.jokes:
+        if not self.rendered:
             return ""
-        return render_joke(random.choice(self.jokes))
+        if self._cursor >= len(self.rendered):
+            random.shuffle(self.rendered)
+            self._cursor = 0
+        choice = self.rendered[self._cursor]
+        self._cursor += 1
+        return choice
 
     @app_commands.command(name="joke", description="Tell a random Aura joke.")
     async def joke(self, interaction: discord.Interaction):
@@ -18,8 +18,8 @@ _UNIT_MAP = {
     "w": 604800, "wk": 604800, "wks": 604800, "week": 604800, "weeks": 604800,
 }
 
-_time12 = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*([ap]m)\s*$", re.I)
-_time24 = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*$")
+# one pass for both "3pm"/"3:30 pm" (12h) and "15:30" (24h)
+_time_of_day = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*([ap]m)?\s*$", re.I)
 _date_dash = re.compile(r"^\s*(\d{4})-(\d{1,2})-(\d{1,2})(?:[ T](\d{1,2})(?::(\d{2}))?\s*([ap]m)?)?\s*$", re.I)
 _date_slash_full = re.compile(r"^\s*(\d{4})/(\d{1,2})/(\d{1,2})(?:\s+(\d{1,2})(?::(\d{2}))?\s*([ap]m)?)?\s*$", re.I)
 _date_slash_short = re.compile(r"^\s*(\d{1,2})/(\d{1,2})(?:\s+(\d{1,2})(?::(\d{2}))?\s*([ap]m)?)?\s*$", re.I)
@@ -27,16 +27,16 @@ _duration = re.compile(r"(?P<num>\d+)\s*(?P<unit>[a-zA-Z]+)")
 
 def _parse_time_fragment(s: str):
     s = s.strip()
-    m = _time12.match(s)
-    if m:
-        hh = int(m.group(1)); mm = int(m.group(2) or 0); ap = m.group(3).lower()
+    m = _time_of_day.match(s)
+    if not m:
+        return None
+    hh = int(m.group(1)); mm = int(m.group(2) or 0); ap = (m.group(3) or "").lower()
+    if ap:
         if hh == 12: hh = 0
         if ap == "pm": hh += 12
-        return hh, mm
-    m = _time24.match(s)
-    if m:
-        return int(m.group(1)), int(m.group(2))
-    return None
+    elif m.group(2) is None:
+        return None  # a bare number isn't a time of day
+    return hh, mm
 
 def _parse_duration(s: str) -> timedelta | None:
     s = s.lower().strip()
@@ -148,18 +148,14 @@ class RemindCog(commands.Cog):
         if len(about) > 200:
             about = about[:200] + "…"
 
-        # store
-        reminder = {
-            "user_id": interaction.user.id,
-            "channel_id": interaction.channel.id if isinstance(interaction.channel, (discord.TextChannel, discord.Thread)) else interaction.user.id,
-            "message": about,
-            "time": target_utc
-        }
-        # Use bot’s storage helpers
+        # store via the bot’s storage helpers
         try:
-            self.bot.reminders.append(reminder)
-            # convert time to ISO for file persistence
-            self.bot.save_reminders()
+            self.bot.add_reminder(
+                user_id=interaction.user.id,
+                channel_id=interaction.channel.id if isinstance(interaction.channel, (discord.TextChannel, discord.Thread)) else interaction.user.id,
+                message=about,
+                due=target_utc.timestamp(),
+            )
         except Exception:
             return await interaction.response.send_message("I couldn't save that reminder. Check logs.", ephemeral=True)
 
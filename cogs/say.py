@@ -2,12 +2,25 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import datetime
+import re
 
 LOG_CHANNEL_ID = 1427716795615285329  # your say log channel
+MASS_MENTION_RE = re.compile(r"@(everyone|here)|<@&\d+>")
 
 class Say(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self._log_channel = None  # resolved on first use
+
+    def _get_log_channel(self):
+        if self._log_channel is None:
+            self._log_channel = self.bot.get_channel(LOG_CHANNEL_ID)
+        return self._log_channel
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        if channel.id == LOG_CHANNEL_ID:
+            self._log_channel = None
 
     @app_commands.command(name="say", description="Make Aura speak a message as the bot.")
     @app_commands.describe(
@@ -17,11 +30,16 @@ class Say(commands.Cog):
     async def say(self, interaction: discord.Interaction, message: str, channel: discord.TextChannel = None):
         target = channel or interaction.channel
 
+        # every form of mass mention contains '@'; skip the regex for the usual case
+        if "@" in message and MASS_MENTION_RE.search(message):
+            await interaction.response.send_message("I won't ping @everyone, @here, or roles.", ephemeral=True)
+            return
+
         # Send the message as Aura
         await target.send(message)
 
         # Log it to your say log channel
-        log_channel = self.bot.get_channel(LOG_CHANNEL_ID)
+        log_channel = self._get_log_channel()
         if log_channel:
             embed = discord.Embed(
                 title="🗣️ Aura said something",
@@ -2,13 +2,19 @@
 # FILE: main.py
 # =========================
 import discord
-from discord.ext import tasks, commands
-import os, json, random, logging
-from datetime import datetime
+from discord.ext import commands
+import os, json, random, logging, heapq, itertools, asyncio, time, hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
-from flask import Flask
-from threading import Thread
+import aiohttp
+from aiohttp import web
+
+try:
+    import orjson  # optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 # ────────────── CONFIG ──────────────
 load_dotenv()
@@ -30,6 +36,7 @@ INITIAL_EXTENSIONS = [
     "cogs.flip",
     "cogs.profile",
     "cogs.archive_forward",
+    "cogs.remind",
 ]
 
 DATA_DIR = Path(__file__).parent / "data"
@@ -38,44 +45,126 @@ HOURLIES_FILE = "AURA.HOURLIES.v2.json"
 
 AUTOPOST_MAP_FILE = DATA_DIR / "autopost_map.json"
 GUILD_FLAGS_FILE = DATA_DIR / "guild_flags.json"
+REMINDERS_FILE = DATA_DIR / "reminders.json"
+COMMAND_HASH_FILE = DATA_DIR / "command_tree.sha256"
 
 QUIET_SECONDS = 97 * 60  # 97 minutes
+AUTOPOST_RETRY_SECONDS = 60  # after a failed send or an unresolved target
+CONFIG_POLL_SECONDS = 60  # hand edits to autopost_map/guild_flags apply within this
+REMINDER_FLUSH_DELAY = 5  # seconds; coalesces bursts of reminder writes
+REMINDER_RETRY_SECONDS = 60  # after a transient delivery failure (5xx, 429, network)
+REMINDER_MAX_ATTEMPTS = 10  # transient failures in a row before a reminder is dropped
+ACTIVITY_RESOLUTION = 5  # seconds; finer activity stamps can't matter against QUIET_SECONDS
 
 # ────────────── HELPERS ──────────────
+# path -> (mtime_ns, parsed); autopost map/flags are re-read every pass but rarely change
+_CONFIG_CACHE: dict[str, tuple[int, object]] = {}
+
 def _load_json(p: Path, default):
+    """Parsed JSON at `p`, reused until the file's mtime changes. Treat as read-only."""
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        mtime = p.stat().st_mtime_ns
+        hit = _CONFIG_CACHE.get(str(p))
+        if hit and hit[0] == mtime:
+            return hit[1]
+        obj = orjson.loads(p.read_bytes()) if orjson else json.loads(p.read_text(encoding="utf-8"))
+        _CONFIG_CACHE[str(p)] = (mtime, obj)
+        return obj
     except Exception:
         return default
 
+# path -> ((mtime_ns, size), items); skips re-reading/parsing line packs that haven't changed
+_JSON_CACHE: dict[str, tuple[tuple[int, int], tuple[str, ...]]] = {}
+
+def _item_text(x):
+    return str(x.get("text", x)) if isinstance(x, dict) else str(x)
+
 def _load_items_from_json(filename: str):
     fp = DATA_DIR / filename
     try:
-        obj = json.loads(fp.read_text(encoding="utf-8"))
+        st = fp.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        hit = _JSON_CACHE.get(str(fp))
+        if hit and hit[0] == stamp:
+            return list(hit[1])
+
+        if orjson:
+            obj = orjson.loads(fp.read_bytes())
+        else:
+            obj = json.loads(fp.read_text(encoding="utf-8"))
+        items = []
         if isinstance(obj, dict) and "items" in obj:
-            return [it.get("text", "") for it in obj["items"] if isinstance(it, dict)]
-        if isinstance(obj, list):
-            return [str(x.get("text", x)) if isinstance(x, dict) else str(x) for x in obj]
+            items = [it.get("text", "") for it in obj["items"] if isinstance(it, dict)]
+        elif isinstance(obj, list):
+            items = [_item_text(x) for x in obj]
+        _JSON_CACHE[str(fp)] = (stamp, tuple(items))
+        return items
     except Exception as e:
-        logger.warning(f"Failed loading {filename}: {e}")
+        logger.warning("Failed loading %s: %s", filename, e)
     return []
 
 def load_lines_or_default(file, fallback):
     lines = _load_items_from_json(file)
     return lines if lines else fallback
 
-# ────────────── KEEP ALIVE ──────────────
-app = Flask("")
-
-@app.route("/")
-def home():
-    return "Aura online"
-
-def run_web():
-    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 8000)))
+@dataclass(slots=True, order=True)
+class Reminder:
+    # heap order is (due, seq); seq breaks ties between equal due times
+    due: float  # epoch seconds
+    seq: int
+    user_id: int = field(compare=False)
+    channel_id: int = field(compare=False)
+    message: str = field(compare=False)
+    attempts: int = field(default=0, compare=False)  # failed deliveries so far
+
+def _next_utc_midnight() -> float:
+    """Monotonic deadline of the next UTC midnight (POSIX days are exactly 86400s)."""
+    return time.monotonic() + 86400 - time.time() % 86400
+
+class RotationPool:
+    """Shuffled deck + cursor: O(1) per draw, no repeats until the deck is used up.
+
+    The deck is also reshuffled at the start of each UTC day.
+    """
+    __slots__ = ("items", "idx", "reset_at")
+
+    def __init__(self, items=()):
+        self.items = list(items)
+        random.shuffle(self.items)
+        self.idx = 0
+        self.reset_at = _next_utc_midnight()
+
+    def next(self) -> str:
+        if self.idx >= len(self.items) or time.monotonic() >= self.reset_at:
+            random.shuffle(self.items)
+            self.idx = 0
+            self.reset_at = _next_utc_midnight()
+        choice = self.items[self.idx]
+        self.idx += 1
+        return choice
 
-def keep_alive():
-    Thread(target=run_web, daemon=True).start()
+# ────────────── KEEP ALIVE ──────────────
+async def _home(request):
+    return web.Response(text="Aura online")
+
+async def _health(request):
+    return web.Response(text="ok")
+
+async def start_web():
+    # served on the bot's own event loop — no extra thread
+    app = web.Application()
+    app.router.add_get("/", _home)
+    app.router.add_get("/health", _health)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, "0.0.0.0", int(os.environ.get("PORT", 8000))).start()
+    except OSError as e:
+        # port taken (e.g. a second local instance): run the bot without it
+        logger.error("Keep-alive server not started: %s", e)
+        await runner.cleanup()
+        return None
+    return runner
 
 # ────────────── BOT ──────────────
 intents = discord.Intents.default()
@@ -83,44 +172,209 @@ intents.message_content = True
 intents.guilds = True
 intents.messages = True
 
+# autopost content is ours, never a ping
+NO_MENTIONS = discord.AllowedMentions.none()
+
+def owner_only_mentions(user_id: int) -> discord.AllowedMentions:
+    """Reminder text is user-supplied: ping its owner, never @everyone/roles/others."""
+    return discord.AllowedMentions(everyone=False, roles=False, users=[discord.Object(user_id)])
+
 class AuraBot(commands.Bot):
     def __init__(self):
         super().__init__(command_prefix="!", intents=intents)
-        self.presence_pool = []
-        self.hourly_pool = []
+        self.presence_pool = RotationPool()
+        self.hourly_pool = RotationPool()
+        # monotonic timestamps; only ever compared as "seconds since"
         self.last_channel_activity = {}
         self.last_post_per_channel = {}
+        self.autopost_channel_ids = set()
         self.rotation_index = 0
-        self.last_reset_date = None
         self.guild_silent_state = {}
         self.booted_at = None
+        self.reminders: list[Reminder] = []  # min-heap by due time
+        self._reminder_seq = itertools.count()
+        self._scheduler_wakeup = asyncio.Event()
+        self._scheduler_task = None
+        self._next_autopost = 0.0  # monotonic deadline for the next autopost pass
+        self._config_stamp = None  # autopost config mtimes seen by the scheduler
+        self._reminders_dirty = False
+        self._flush_task = None
+        self._save_lock = asyncio.Lock()  # one reminders.tmp writer at a time
+        self._web_runner = None
+
+    async def start(self, token, *, reconnect=True):
+        # bind before login so the host's port check doesn't wait on Discord
+        if self._web_runner is None:
+            self._web_runner = await start_web()
+        await super().start(token, reconnect=reconnect)
 
     async def setup_hook(self):
-        for ext in INITIAL_EXTENSIONS:
-            await self.load_extension(ext)
-
-    def reset_daily(self):
-        today = datetime.utcnow().date()
-        if self.last_reset_date != today:
-            random.shuffle(self.presence_pool)
-            random.shuffle(self.hourly_pool)
-            self.last_reset_date = today
+        # cogs are independent; one bad cog shouldn't keep the rest from loading
+        results = await asyncio.gather(
+            *(self.load_extension(ext) for ext in INITIAL_EXTENSIONS),
+            return_exceptions=True,
+        )
+        failed = False
+        for ext, res in zip(INITIAL_EXTENSIONS, results):
+            if isinstance(res, BaseException):
+                failed = True
+                logger.error("Failed to load %s", ext, exc_info=res)
+        # a partial tree would delete the missing cogs' commands globally
+        if failed:
+            logger.warning("Skipping command sync: not every extension loaded")
+        else:
+            await self.sync_commands()
+
+    async def sync_commands(self):
+        """Global sync only when the command schema changed (or AURA_SYNC_COMMANDS=1)."""
+        # sorted: registration order depends on how concurrent cog loads interleave
+        payload = sorted(
+            (cmd.to_dict(self.tree) for cmd in self.tree.get_commands()),
+            key=lambda c: c["name"],
+        )
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        try:
+            stored = COMMAND_HASH_FILE.read_text(encoding="utf-8").strip()
+        except Exception:
+            stored = None
+
+        if stored == digest and os.getenv("AURA_SYNC_COMMANDS") != "1":
+            logger.info("Command tree unchanged, skipping sync")
+            return
+
+        try:
+            await self.tree.sync()
+        except Exception as e:
+            # transient Discord errors shouldn't stop startup; the hash stays
+            # stale so the next boot tries again
+            logger.error("Command sync failed: %s", e)
+            return
+        try:
+            COMMAND_HASH_FILE.write_text(digest, encoding="utf-8")
+        except Exception as e:
+            logger.warning("Could not store command hash: %s", e)
+
+    async def close(self):
+        await self.flush_reminders()
+        if self._web_runner:
+            await self._web_runner.cleanup()
+            self._web_runner = None
+        await super().close()
+
+    def next_presence(self):
+        return self.presence_pool.next()
 
     def next_hourly(self):
-        self.reset_daily()
-        return random.choice(self.hourly_pool)
+        return self.hourly_pool.next()
+
+    def poke_autopost(self):
+        """Re-evaluate autopost now (config changed, e.g. via /admin_*)."""
+        self._next_autopost = 0.0
+        self._scheduler_wakeup.set()
+
+    # ---- reminders ----
+    def add_reminder(self, user_id: int, channel_id: int, message: str, due: float):
+        reminder = Reminder(due, next(self._reminder_seq), user_id, channel_id, message)
+        heapq.heappush(self.reminders, reminder)
+        self._schedule_save()
+        # new head -> the scheduler is sleeping too long, wake it to re-arm
+        if self.reminders[0] is reminder:
+            self._scheduler_wakeup.set()
+
+    def load_reminders(self):
+        # read once at startup, so skip _load_json's cache and let the parse go
+        try:
+            raw = (orjson.loads(REMINDERS_FILE.read_bytes()) if orjson
+                   else json.loads(REMINDERS_FILE.read_text(encoding="utf-8")))
+        except Exception:
+            raw = []
+        heap = []
+        for r in raw if isinstance(raw, list) else []:
+            try:
+                if "due" in r:
+                    due = float(r["due"])
+                else:  # older files stored an ISO "time"
+                    when = datetime.fromisoformat(r["time"])
+                    if when.tzinfo is None:
+                        when = when.replace(tzinfo=timezone.utc)
+                    due = when.timestamp()
+                reminder = Reminder(
+                    due, next(self._reminder_seq),
+                    int(r["user_id"]), int(r["channel_id"]), str(r["message"]),
+                    int(r.get("attempts", 0)),
+                )
+            except Exception:
+                continue
+            heap.append(reminder)
+        heapq.heapify(heap)
+        self.reminders = heap
+        logger.info("Loaded %d reminders", len(heap))
+
+    def _reminders_payload(self):
+        return [
+            {
+                "user_id": r.user_id,
+                "channel_id": r.channel_id,
+                "message": r.message,
+                "due": r.due,
+                "attempts": r.attempts,
+            }
+            for r in self.reminders
+        ]
+
+    @staticmethod
+    def _write_reminders_sync(data):
+        # tmp + replace so a crash mid-write never leaves a truncated file
+        tmp = REMINDERS_FILE.with_suffix(".tmp")
+        # compact: the file is machine state, not something edited by hand
+        if orjson:
+            tmp.write_bytes(orjson.dumps(data))
+        else:
+            tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(REMINDERS_FILE)
+
+    def _schedule_save(self):
+        # write-behind: mark dirty and let one delayed flush cover the burst
+        self._reminders_dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_soon())
+
+    async def _flush_soon(self):
+        # changes made while a write is in flight see this task still running
+        # and don't start their own, so keep going until nothing is left
+        while self._reminders_dirty:
+            await asyncio.sleep(REMINDER_FLUSH_DELAY)
+            await self.flush_reminders()
+
+    async def flush_reminders(self):
+        async with self._save_lock:
+            if not self._reminders_dirty:
+                return
+            self._reminders_dirty = False
+            data = self._reminders_payload()  # snapshot on the loop, write off it
+            try:
+                await asyncio.to_thread(self._write_reminders_sync, data)
+            except Exception as e:
+                self._reminders_dirty = True
+                logger.error("Saving reminders failed: %s", e)
 
 bot = AuraBot()
 
 # ────────────── LOAD DATA ──────────────
-bot.presence_pool = load_lines_or_default(
+# immutable source lines; the bot rotates through its own shuffled copies
+PRESENCE_LINES = tuple(load_lines_or_default(
     PRESENCE_FILE,
-    ["quiet, steady, present"]
-)
-bot.hourly_pool = load_lines_or_default(
+    ("quiet, steady, present",)
+))
+HOURLY_LINES = tuple(load_lines_or_default(
     HOURLIES_FILE,
-    ["🍀 Clover check-in"]
-)
+    ("🍀 Clover check-in",)
+))
+bot.presence_pool = RotationPool(PRESENCE_LINES)
+bot.hourly_pool = RotationPool(HOURLY_LINES)
+bot.load_reminders()
 
 # ────────────── EVENTS ──────────────
 @bot.event
@@ -128,47 +382,99 @@ async def on_ready():
     await bot.change_presence(
         activity=discord.Activity(
             type=discord.ActivityType.watching,
-            name=random.choice(bot.presence_pool)
+            name=bot.next_presence()
         )
     )
 
-    await bot.tree.sync()
-
     bot.booted_at = datetime.utcnow()
     bot.rotation_index = 0
     bot.guild_silent_state = {}
     bot.last_post_per_channel = {}
 
-    if not autopost_loop.is_running():
-        autopost_loop.start()
+    if bot._scheduler_task is None or bot._scheduler_task.done():
+        bot._scheduler_task = asyncio.create_task(scheduler())
+    bot.poke_autopost()
+
+@bot.event
+async def on_guild_join(guild):
+    bot.poke_autopost()
 
 @bot.event
 async def on_message(message):
     if message.author.bot:
         return
 
-    if isinstance(message.channel, (discord.TextChannel, discord.Thread)):
-        cid = (
-            message.channel.id
-            if isinstance(message.channel, discord.TextChannel)
-            else message.channel.parent_id
-        )
-        if cid:
-            bot.last_channel_activity[cid] = datetime.utcnow()
+    # only autopost targets' activity is ever read; skip the write for the rest
+    if bot.autopost_channel_ids:
+        ch = message.channel
+        cid = ch.parent_id if isinstance(ch, discord.Thread) else ch.id
+        if cid in bot.autopost_channel_ids:
+            now = time.monotonic()
+            if now - bot.last_channel_activity.get(cid, 0.0) > ACTIVITY_RESOLUTION:
+                bot.last_channel_activity[cid] = now
 
     await bot.process_commands(message)
 
 # ────────────── AUTPOST LOOP ──────────────
-@tasks.loop(minutes=1)
-async def autopost_loop():
-    ap_map = _load_json(AUTOPOST_MAP_FILE, {})
+# (source map, {guild id: channel ids}, all channel ids); rebuilt only when _load_json re-parses the map
+_AUTOPOST_TARGETS = (None, {}, frozenset())
+
+def _autopost_targets(ap_map):
+    global _AUTOPOST_TARGETS
+    if _AUTOPOST_TARGETS[0] is not ap_map:
+        targets = {}
+        for gid, channel_ids in (ap_map.items() if isinstance(ap_map, dict) else ()):
+            if not str(gid).isdigit():
+                continue
+            if isinstance(channel_ids, str):
+                channel_ids = [channel_ids]
+            if not isinstance(channel_ids, list):
+                continue
+            cid_ints = []
+            for cid in channel_ids:
+                try:
+                    cid_ints.append(int(cid))
+                except Exception:
+                    continue
+            if cid_ints:
+                targets[str(gid)] = tuple(cid_ints)
+        all_ids = frozenset(c for cids in targets.values() for c in cids)
+        _AUTOPOST_TARGETS = (ap_map, targets, all_ids)
+    return _AUTOPOST_TARGETS[1], _AUTOPOST_TARGETS[2]
+
+async def _autopost_send(channel, content):
+    if content:
+        await channel.send(content, allowed_mentions=NO_MENTIONS)
+
+async def autopost_pass():
+    """Post to every eligible channel; return seconds until one could be due again."""
+    ap_map = _load_json(AUTOPOST_MAP_FILE, None)
+    if ap_map is None:
+        # missing or unparsable (e.g. a bad hand edit): keep the activity we
+        # have, or chatty channels would look quiet once the file is fixed
+        return QUIET_SECONDS
+    targets, autopost_ids = _autopost_targets(ap_map)
+
+    # on_message records activity only for these; forget channels no longer targeted
+    bot.autopost_channel_ids = autopost_ids
+    bot.last_channel_activity = {
+        c: t for c, t in bot.last_channel_activity.items() if c in autopost_ids
+    }
+    if not targets:
+        return QUIET_SECONDS
+
     flags = _load_json(GUILD_FLAGS_FILE, {})
-    now = datetime.utcnow()
+    now = time.monotonic()
     posted_any = False
+    next_in = QUIET_SECONDS
     jokes_cog = bot.get_cog("JokesCog")
+    pending = []  # (channel id, channel, content)
 
-    for guild in bot.guilds:
-        gid = str(guild.id)
+    for gid, cid_ints in targets.items():
+        if bot.get_guild(int(gid)) is None:
+            # not cached yet (or left); look again soon rather than in QUIET_SECONDS
+            next_in = min(next_in, AUTOPOST_RETRY_SECONDS)
+            continue
         silent_now = bool(flags.get(gid, {}).get("silent", False))
         silent_prev = bot.guild_silent_state.get(gid, None)
         bot.guild_silent_state[gid] = silent_now
@@ -176,52 +482,150 @@ async def autopost_loop():
         if silent_now:
             continue
 
-        channel_ids = ap_map.get(gid, [])
-        if isinstance(channel_ids, str):
-            channel_ids = [channel_ids]
-        if not isinstance(channel_ids, list):
-            channel_ids = []
-
-        for i, cid in enumerate(channel_ids):
-            try:
-                cid_int = int(cid)
-            except Exception:
-                continue
-
+        for i, cid_int in enumerate(cid_ints):
             channel = bot.get_channel(cid_int)
             if not channel:
+                next_in = min(next_in, AUTOPOST_RETRY_SECONDS)
                 continue
 
             last_human = bot.last_channel_activity.get(cid_int)
-            if last_human and (now - last_human).total_seconds() < QUIET_SECONDS:
-                continue
+            if last_human:
+                wait = QUIET_SECONDS - (now - last_human)
+                if wait > 0:
+                    next_in = min(next_in, wait)
+                    continue
 
             last_post = bot.last_post_per_channel.get(cid_int)
-            if last_post and (now - last_post).total_seconds() < QUIET_SECONDS:
-                continue
+            if last_post:
+                wait = QUIET_SECONDS - (now - last_post)
+                if wait > 0:
+                    next_in = min(next_in, wait)
+                    continue
 
             assign_index = (i + bot.rotation_index) % 2
 
-            try:
-                if assign_index == 0 and jokes_cog:
-                    msg = jokes_cog.get_random_joke()
-                    if msg:
-                        await channel.send(msg)
-                else:
-                    await channel.send(bot.next_hourly())
-
-                bot.last_post_per_channel[cid_int] = now
-                posted_any = True
-            except Exception:
-                continue
+            if assign_index == 0 and jokes_cog:
+                content = jokes_cog.get_random_joke()
+            else:
+                content = bot.next_hourly()
+            pending.append((cid_int, channel, content))
 
         if silent_prev is True and silent_now is False:
             bot.last_post_per_channel = {}
+            next_in = 0
+
+    # independent channels: send concurrently rather than one await at a time
+    results = await asyncio.gather(
+        *(_autopost_send(channel, content) for _, channel, content in pending),
+        return_exceptions=True,
+    )
+    for (cid_int, _, _), res in zip(pending, results):
+        if isinstance(res, BaseException):
+            next_in = min(next_in, AUTOPOST_RETRY_SECONDS)
+        else:
+            bot.last_post_per_channel[cid_int] = now
+            posted_any = True
 
     if posted_any:
         bot.rotation_index += 1
 
+    return next_in
+
+# ────────────── REMINDERS ──────────────
+async def _deliver_reminder(reminder):
+    uid = reminder.user_id
+    if reminder.channel_id == uid:
+        # channel_id falls back to the user id for DMs
+        channel = bot.get_user(uid) or await bot.fetch_user(uid)
+    else:
+        # archived threads drop out of the cache; NotFound/Forbidden are permanent
+        channel = bot.get_channel(reminder.channel_id) or await bot.fetch_channel(reminder.channel_id)
+    # a mention only needs the id, no User object required
+    await channel.send(
+        f"⏰ <@{uid}> Reminder: {reminder.message}",
+        allowed_mentions=owner_only_mentions(uid),
+    )
+
+def _reminder_error_is_transient(exc: BaseException) -> bool:
+    # only outages are worth another try; 4xx (Forbidden, NotFound, ...) and
+    # bugs would fail the same way every time
+    if isinstance(exc, discord.HTTPException):
+        return exc.status >= 500 or exc.status == 429
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError, OSError, asyncio.CancelledError))
+
+async def fire_due_reminders():
+    now_ts = time.time()
+    due = []
+    while bot.reminders and bot.reminders[0].due <= now_ts:
+        due.append(heapq.heappop(bot.reminders))
+    if not due:
+        return
+
+    # concurrent, like the autopost fan-out
+    results = await asyncio.gather(*(_deliver_reminder(r) for r in due), return_exceptions=True)
+    for reminder, res in zip(due, results):
+        if not isinstance(res, BaseException):
+            continue
+        if not _reminder_error_is_transient(res):
+            if isinstance(res, discord.HTTPException):
+                logger.warning("Dropping reminder for %s: %s", reminder.user_id, res)
+            else:
+                logger.exception("Dropping reminder for %s", reminder.user_id, exc_info=res)
+            continue
+        reminder.attempts += 1
+        if reminder.attempts >= REMINDER_MAX_ATTEMPTS:
+            logger.warning("Dropping reminder for %s after %d attempts: %s", reminder.user_id, reminder.attempts, res)
+            continue
+        # keep it in the heap so the next save doesn't lose it
+        logger.warning("Reminder delivery failed, retrying: %s", res)
+        reminder.due = time.time() + REMINDER_RETRY_SECONDS
+        reminder.seq = next(bot._reminder_seq)
+        heapq.heappush(bot.reminders, reminder)
+
+    bot._schedule_save()
+
+# ────────────── SCHEDULER ──────────────
+def _config_stamp():
+    stamp = []
+    for p in (AUTOPOST_MAP_FILE, GUILD_FLAGS_FILE):
+        try:
+            stamp.append(p.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+async def scheduler():
+    # One task for all timed work. It sleeps until the nearest deadline — the
+    # reminder heap head or the next autopost pass — and add_reminder /
+    # poke_autopost wake it early. It also wakes every CONFIG_POLL_SECONDS to
+    # stat the autopost config. Human activity only pushes autopost deadlines
+    # later, so messages never need to wake it.
+    while True:
+        bot._scheduler_wakeup.clear()
+        await fire_due_reminders()
+
+        # files edited by hand don't go through poke_autopost
+        stamp = _config_stamp()
+        if stamp != bot._config_stamp:
+            bot._config_stamp = stamp
+            bot._next_autopost = 0.0
+
+        if time.monotonic() >= bot._next_autopost:
+            try:
+                delay = await autopost_pass()
+            except Exception as e:
+                logger.warning("Autopost pass failed: %s", e)
+                delay = AUTOPOST_RETRY_SECONDS
+            bot._next_autopost = time.monotonic() + max(delay, 1)
+
+        timeout = min(bot._next_autopost - time.monotonic(), CONFIG_POLL_SECONDS)
+        if bot.reminders:
+            timeout = min(timeout, bot.reminders[0].due - time.time())
+        try:
+            await asyncio.wait_for(bot._scheduler_wakeup.wait(), timeout=max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+
 # ────────────── ENTRY ──────────────
 if __name__ == "__main__":
-    keep_alive()
     bot.run(os.getenv("DISCORD_TOKEN"))